@@ -5,9 +5,10 @@ Handles automatic login and token management for QUADS API calls.
 
 import asyncio
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
+import orjson
 
 
 class QuadsAuthManager:
@@ -24,6 +25,7 @@ class QuadsAuthManager:
         auth_token: Optional[str] = None,
         timeout: int = 30,
         verify_ssl: bool = True,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the authentication manager.
@@ -35,6 +37,7 @@ class QuadsAuthManager:
             auth_token: Pre-existing auth token (if available)
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates (set False for self-signed)
+            client: Shared HTTP client to reuse pooled connections (optional)
         """
         self.base_url = base_url.rstrip("/")
         self.username = username
@@ -42,6 +45,13 @@ class QuadsAuthManager:
         self.timeout = timeout
         self.verify_ssl = verify_ssl
 
+        # Reuse a single client so keep-alive connections are pooled across calls;
+        # requests rely on the client's timeout rather than passing one per call
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            base_url=self.base_url, verify=verify_ssl, timeout=timeout
+        )
+
         # Token management
         self._auth_token: Optional[str] = auth_token
         self._token_expires_at: Optional[float] = None
@@ -104,7 +114,7 @@ class QuadsAuthManager:
 
             try:
                 await self._perform_login()
-            except Exception as e:
+            except (httpx.HTTPError, ValueError) as e:
                 # Log the error but don't raise - let the API call fail gracefully
                 print(f"Warning: Failed to authenticate with QUADS: {e}")
 
@@ -114,21 +124,20 @@ class QuadsAuthManager:
         """
         login_url = f"{self.base_url}/login/"
 
-        async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-            response = await client.post(
-                login_url, auth=(self.username, self.password), timeout=self.timeout
-            )
-            response.raise_for_status()
+        response = await self.client.post(
+            login_url, auth=(self.username, self.password)
+        )
+        response.raise_for_status()
 
-            result = response.json()
+        result = orjson.loads(response.content)
 
-            if "auth_token" in result:
-                self._auth_token = result["auth_token"]
-                # Set expiry time (assume 1 hour if not specified)
-                self._token_expires_at = time.time() + self._token_ttl
-                print(f"✅ Successfully authenticated with QUADS API")
-            else:
-                raise ValueError("Login response did not contain auth_token")
+        if "auth_token" in result:
+            self._auth_token = result["auth_token"]
+            # Set expiry time (assume 1 hour if not specified)
+            self._token_expires_at = time.time() + self._token_ttl
+            print(f"✅ Successfully authenticated with QUADS API")
+        else:
+            raise ValueError("Login response did not contain auth_token")
 
     async def logout(self) -> None:
         """
@@ -141,36 +150,44 @@ class QuadsAuthManager:
             logout_url = f"{self.base_url}/logout/"
             headers = {"Authorization": f"Bearer {self._auth_token}"}
 
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                await client.post(logout_url, headers=headers, timeout=self.timeout)
+            await self.client.post(logout_url, headers=headers)
 
             print("✅ Successfully logged out from QUADS API")
-        except Exception as e:
+        except httpx.HTTPError as e:
             print(f"Warning: Failed to logout from QUADS: {e}")
         finally:
             # Clear token regardless of logout success
             self._auth_token = None
             self._token_expires_at = None
 
+    async def aclose(self) -> None:
+        """
+        Close the HTTP client if this manager created it.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
     async def make_authenticated_request(
-        self, method: str, url: str, **kwargs
+        self, method: str, url: Union[str, httpx.URL], stream: bool = False, **kwargs
     ) -> httpx.Response:
         """
         Make an authenticated HTTP request to QUADS API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            url: Full URL or path (if starts with /, will be appended to base_url)
+            url: Full URL (str or httpx.URL) or path (appended to base_url)
+            stream: Return without reading the body; the caller must close it
             **kwargs: Additional arguments for httpx request
 
         Returns:
             HTTP response
         """
-        # Handle relative URLs
-        if url.startswith("/"):
-            url = self.base_url + url
-        elif not url.startswith("http"):
-            url = f"{self.base_url}/{url}"
+        # Handle relative URLs (the shared client resolves them against its base_url)
+        if isinstance(url, str) and self.client.base_url == httpx.URL(""):
+            if url.startswith("/"):
+                url = self.base_url + url
+            elif not url.startswith("http"):
+                url = f"{self.base_url}/{url}"
 
         # Get authentication headers
         auth_headers = await self.get_auth_headers()
@@ -180,28 +197,27 @@ class QuadsAuthManager:
         headers.update(auth_headers)
         kwargs["headers"] = headers
 
-        # Set timeout if not specified
-        if "timeout" not in kwargs:
-            kwargs["timeout"] = self.timeout
+        request = self.client.build_request(method, url, **kwargs)
+        response = await self.client.send(request, stream=stream)
 
-        async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-            response = await client.request(method, url, **kwargs)
+        # If we get a 401, try to re-authenticate once
+        if response.status_code == 401 and self.username and self.password:
+            await response.aclose()
 
-            # If we get a 401, try to re-authenticate once
-            if response.status_code == 401 and self.username and self.password:
-                # Clear current token and try to login again
-                self._auth_token = None
-                self._token_expires_at = None
+            # Clear current token and try to login again
+            self._auth_token = None
+            self._token_expires_at = None
 
-                # Get fresh auth headers
-                auth_headers = await self.get_auth_headers()
-                headers.update(auth_headers)
-                kwargs["headers"] = headers
+            # Get fresh auth headers
+            auth_headers = await self.get_auth_headers()
+            headers.update(auth_headers)
+            kwargs["headers"] = headers
 
-                # Retry the request
-                response = await client.request(method, url, **kwargs)
+            # Retry the request
+            request = self.client.build_request(method, url, **kwargs)
+            response = await self.client.send(request, stream=stream)
 
-            return response
+        return response
 
 
 # Global auth manager instance - will be initialized by server.py
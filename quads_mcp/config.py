@@ -3,6 +3,7 @@ Configuration management for the MCP server.
 Handles loading configuration from environment variables and/or config files.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
@@ -16,6 +17,7 @@ except ImportError:
     DOTENV_AVAILABLE = False
 
 
+@functools.cache
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from environment variables and/or config file.
@@ -25,6 +27,9 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
     Also loads from .env files if python-dotenv is available.
 
+    The result is cached per config_path; call load_config.cache_clear()
+    to force a reload (e.g. after changing the environment in tests).
+
     Args:
         config_path: Optional path to a JSON config file
 
@@ -44,6 +44,7 @@ def quads_host_search(search_criteria: str) -> str:
 
     - `quads_get_hosts()` - Get all hosts with optional filtering
     - `quads_get_host_details()` - Get detailed information for specific hosts
+    - `quads_get_hosts_details()` - Get detailed information for many hosts at once
     - `quads_get_available_hosts()` - Check host availability
     - `quads_check_host_availability()` - Check specific host availability
 
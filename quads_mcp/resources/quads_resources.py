@@ -80,6 +80,7 @@ def quads_hosts_resource() -> str:
     quads_get_hosts(model="r640")        # Filter by model
     quads_get_hosts(broken=False)        # Filter by status
     quads_get_host_details("hostname")   # Get detailed specs
+    quads_get_hosts_details(["h1", "h2"]) # Get specs for several hosts
     ```
     
     ## Host Properties
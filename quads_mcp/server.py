@@ -3,11 +3,15 @@ Main MCP server implementation.
 This file initializes the FastMCP server and imports all tools, resources, and prompts.
 """
 
+import asyncio
 import sys
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
 
+import anyio
+import httpx
+from cachetools import LRUCache, TLRUCache
 from mcp.server.fastmcp import Context, FastMCP
 
 from .auth import QuadsAuthManager, set_auth_manager
@@ -15,6 +19,27 @@ from .auth import QuadsAuthManager, set_auth_manager
 # Import config management
 from .config import load_config
 
+try:
+    import uvloop  # noqa: F401
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Fixed QUADS API paths whose absolute URLs are parsed once at startup
+QUADS_ENDPOINTS = (
+    "/clouds/",
+    "/clouds/free/",
+    "/hosts/",
+    "/available/",
+    "/schedules/",
+    "/schedules/current/",
+    "/assignments/",
+    "/assignments/active/",
+    "/moves/",
+    "/version/",
+)
+
 
 @dataclass
 class AppContext:
@@ -24,6 +49,38 @@ class AppContext:
     """
 
     config: dict
+    # Pre-parsed absolute URLs for QUADS_ENDPOINTS, keyed by path
+    urls: dict[str, httpx.URL] = field(default_factory=dict)
+    # In-flight GET requests, shared by identical concurrent tool calls
+    inflight: dict[tuple, asyncio.Task] = field(default_factory=dict)
+    # Short-lived cache of decoded GET responses, stored as (ttl, result)
+    cache: TLRUCache = field(
+        default_factory=lambda: TLRUCache(
+            maxsize=256, ttu=lambda _key, value, now: now + value[0]
+        )
+    )
+    # Last (ETag, result) per cacheable GET, used to revalidate with If-None-Match
+    etags: LRUCache = field(default_factory=lambda: LRUCache(maxsize=256))
+    # (ctx, level, message) entries forwarded to the client by a background task
+    log_queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+
+
+async def _drain_logs(queue: asyncio.Queue) -> None:
+    """
+    Forward queued tool log messages to the client in the background.
+
+    Args:
+        queue: Queue of (ctx, level, message) entries
+    """
+    while True:
+        ctx, level, message = await queue.get()
+        try:
+            await ctx.log(level, message)
+        except Exception:
+            # Logging must never take down the drain task (e.g. client went away)
+            pass
+        finally:
+            queue.task_done()
 
 
 @asynccontextmanager
@@ -43,13 +100,30 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 
     # Initialize QUADS authentication manager
     quads_config = config.get("quads", {})
+    base_url = quads_config.get("base_url", "https://quads.example.com/api/v3")
+    urls = {path: httpx.URL(base_url.rstrip("/") + path) for path in QUADS_ENDPOINTS}
+
+    # Shared HTTP client so all tool calls reuse pooled keep-alive connections;
+    # HTTP/2 lets concurrent tool calls multiplex over a single TLS connection
+    timeout = quads_config.get("timeout", 30)
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        verify=quads_config.get("verify_ssl", True),
+        timeout=httpx.Timeout(timeout, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=200, max_keepalive_connections=100, keepalive_expiry=30
+        ),
+        http2=True,
+    )
+
     auth_manager = QuadsAuthManager(
-        base_url=quads_config.get("base_url", "https://quads.example.com/api/v3"),
+        base_url=base_url,
         username=quads_config.get("username"),
         password=quads_config.get("password"),
         auth_token=quads_config.get("auth_token"),
-        timeout=quads_config.get("timeout", 30),
+        timeout=timeout,
         verify_ssl=quads_config.get("verify_ssl", True),
+        client=client,
     )
 
     # Set the global auth manager for tools to use
@@ -59,24 +133,32 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     print("🚀 Server starting up...")
     if auth_manager.has_credentials:
         if auth_manager.username:
-            print(
-                f"📡 QUADS API: {quads_config.get('base_url')} (user: {auth_manager.username})"
-            )
+            print(f"📡 QUADS API: {base_url} (user: {auth_manager.username})")
         else:
-            print(f"📡 QUADS API: {quads_config.get('base_url')} (token auth)")
+            print(f"📡 QUADS API: {base_url} (token auth)")
     else:
         print(
             "⚠️  No QUADS credentials configured - API calls will not be authenticated"
         )
 
+    app_ctx = AppContext(config=config, urls=urls)
+    log_task = asyncio.create_task(_drain_logs(app_ctx.log_queue))
+
     try:
         # Create and yield the app context
-        yield AppContext(config=config)
+        yield app_ctx
     finally:
         # Clean up resources on shutdown
         print("🛑 Server shutting down...")
+        # Flush pending log messages (briefly) before stopping the drain task
+        with suppress(TimeoutError):
+            await asyncio.wait_for(app_ctx.log_queue.join(), timeout=1.0)
+        log_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await log_task
         if auth_manager:
             await auth_manager.logout()
+        await client.aclose()
 
 
 # Create the MCP server with lifespan support
@@ -101,8 +183,9 @@ def main():
     """
     Main entry point for the QUADS MCP server.
     This function is used by the console script and uvx.
+    Runs on the uvloop event loop when it is installed.
     """
-    mcp.run()
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": UVLOOP_AVAILABLE})
 
 
 if __name__ == "__main__":
@@ -3,18 +3,130 @@ QUADS MCP tools implementation.
 This file contains tool implementations for the QUADS API operations.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
+import orjson
+from cachetools import LRUCache
 
-from ..auth import get_auth_manager
+from ..auth import QuadsAuthManager, get_auth_manager
 
 # Import these at the end to avoid circular imports
-from ..server import Context, mcp
+from ..server import AppContext, Context, mcp
+
+
+def _log(ctx: Context, level: str, message: str) -> None:
+    """
+    Queue a log message for the client without blocking the tool call.
+
+    Args:
+        ctx: Context of the current tool call
+        level: Log level (debug, info, warning, error)
+        message: Message to send
+    """
+    ctx.request_context.lifespan_context.log_queue.put_nowait((ctx, level, message))
+
+
+async def _fetch_json(
+    auth_manager: QuadsAuthManager,
+    url: Union[str, httpx.URL],
+    etags: Optional[LRUCache] = None,
+    etag_key: Optional[tuple] = None,
+    **kwargs,
+) -> Any:
+    """
+    Issue a GET request and decode the streamed JSON body.
+
+    The body is accumulated into a single buffer that orjson decodes in
+    place, instead of httpx's chunk list plus joined copy.
+
+    Args:
+        auth_manager: Authentication manager used to issue the request
+        url: Endpoint path or pre-parsed URL
+        etags: Store of (ETag, result) for conditional requests (optional)
+        etag_key: Key of this request in the ETag store
+        **kwargs: Additional arguments for the request
+
+    Returns:
+        Decoded JSON response
+    """
+    previous = etags.get(etag_key) if etags is not None else None
+    if previous is not None:
+        kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": previous[0]}
+
+    response = await auth_manager.make_authenticated_request(
+        "GET", url, stream=True, **kwargs
+    )
+    try:
+        # Unchanged since the last fetch: reuse the decoded result
+        if previous is not None and response.status_code == 304:
+            return previous[1]
+
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+    finally:
+        await response.aclose()
+
+    result = orjson.loads(body)
+    etag = response.headers.get("ETag")
+    if etags is not None and etag:
+        etags[etag_key] = (etag, result)
+
+    return result
+
+
+async def _coalesced_get(
+    app_ctx: AppContext,
+    auth_manager: QuadsAuthManager,
+    endpoint: str,
+    conditional: bool = False,
+    **kwargs,
+) -> Any:
+    """
+    Issue a GET request, sharing the result with identical concurrent calls.
+
+    Args:
+        app_ctx: Application context holding the in-flight request map
+        auth_manager: Authentication manager used to issue the request
+        endpoint: API endpoint (e.g., '/clouds/')
+        conditional: Revalidate with the last ETag instead of refetching
+        **kwargs: Additional arguments for the request
+
+    Returns:
+        Decoded JSON response
+    """
+    params = kwargs.get("params") or {}
+    key = ("GET", endpoint, tuple(sorted(params.items())))
+
+    task = app_ctx.inflight.get(key)
+    if task is None:
+        # Use the pre-parsed URL for fixed endpoints to skip per-request parsing
+        url = app_ctx.urls.get(endpoint, endpoint)
+        etags = app_ctx.etags if conditional else None
+        task = asyncio.ensure_future(
+            _fetch_json(auth_manager, url, etags=etags, etag_key=key, **kwargs)
+        )
+        app_ctx.inflight[key] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if app_ctx.inflight.get(key) is done:
+                del app_ctx.inflight[key]
+
+        task.add_done_callback(_forget)
+
+    # Shield so a cancelled caller doesn't cancel the request for the others
+    return await asyncio.shield(task)
 
 
 async def make_quads_request(
-    method: str, endpoint: str, ctx: Context, **kwargs
+    method: str,
+    endpoint: str,
+    ctx: Context,
+    cache_ttl: Optional[float] = None,
+    **kwargs,
 ) -> Dict[str, Any]:
     """
     Helper function to make authenticated requests to QUADS API.
@@ -23,6 +135,8 @@ async def make_quads_request(
         method: HTTP method (GET, POST, etc.)
         endpoint: API endpoint (e.g., '/clouds/' or 'clouds/')
         ctx: Context for logging
+        cache_ttl: Seconds to cache a successful GET response (no caching if None);
+            cached endpoints are also revalidated with If-None-Match once expired
         **kwargs: Additional arguments for the request
 
     Returns:
@@ -32,12 +146,12 @@ async def make_quads_request(
 
     if not auth_manager:
         error_msg = "Authentication manager not initialized"
-        ctx.error(error_msg)
+        _log(ctx, "error", error_msg)
         return {"error": error_msg}
 
     if not auth_manager.has_credentials:
         error_msg = "No QUADS credentials configured. Please set MCP_QUADS__USERNAME/PASSWORD or MCP_QUADS__AUTH_TOKEN"
-        ctx.error(error_msg)
+        _log(ctx, "error", error_msg)
         return {"error": error_msg}
 
     try:
@@ -45,24 +159,46 @@ async def make_quads_request(
         if not endpoint.startswith("/"):
             endpoint = "/" + endpoint
 
-        ctx.debug(f"Making {method} request to QUADS: {endpoint}")
-
-        response = await auth_manager.make_authenticated_request(
-            method, endpoint, **kwargs
-        )
-        response.raise_for_status()
-
-        return response.json()
+        app_ctx = ctx.request_context.lifespan_context
+        if cache_ttl is not None:
+            params = kwargs.get("params") or {}
+            cache_key = (endpoint, tuple(sorted(params.items())))
+            cached = app_ctx.cache.get(cache_key)
+            if cached is not None:
+                _log(ctx, "debug", f"Serving cached QUADS response: {endpoint}")
+                return cached[1]
+
+        _log(ctx, "debug", f"Making {method} request to QUADS: {endpoint}")
+
+        if method == "GET":
+            result = await _coalesced_get(
+                app_ctx,
+                auth_manager,
+                endpoint,
+                conditional=cache_ttl is not None,
+                **kwargs,
+            )
+        else:
+            response = await auth_manager.make_authenticated_request(
+                method, endpoint, **kwargs
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+        if cache_ttl is not None and "error" not in result:
+            app_ctx.cache[cache_key] = (cache_ttl, result)
+
+        return result
 
     except httpx.HTTPStatusError as e:
         error_msg = (
             f"QUADS API error {e.response.status_code}: {e.response.reason_phrase}"
         )
-        ctx.error(error_msg)
+        _log(ctx, "error", error_msg)
         return {"error": error_msg, "status_code": e.response.status_code}
-    except Exception as e:
+    except (httpx.HTTPError, httpx.InvalidURL, orjson.JSONDecodeError) as e:
         error_msg = f"QUADS API request failed: {str(e)}"
-        ctx.error(error_msg)
+        _log(ctx, "error", error_msg)
         return {"error": error_msg}
 
 
@@ -86,35 +222,34 @@ async def quads_login(username: str, password: str, ctx: Context) -> Dict[str, A
 
     if not auth_manager:
         error_msg = "Authentication manager not initialized"
-        ctx.error(error_msg)
+        _log(ctx, "error", error_msg)
         return {"error": error_msg}
 
     try:
         # Create a temporary auth manager for manual login
-        from ..auth import QuadsAuthManager
-
         temp_auth = QuadsAuthManager(
             base_url=auth_manager.base_url,
             username=username,
             password=password,
             timeout=auth_manager.timeout,
+            client=auth_manager.client,
         )
 
-        ctx.info(f"Manually logging in to QUADS API")
+        _log(ctx, "info", f"Manually logging in to QUADS API")
 
         # Force login
         await temp_auth._perform_login()
 
-        ctx.info("Successfully logged in to QUADS")
+        _log(ctx, "info", "Successfully logged in to QUADS")
         return {
             "auth_token": temp_auth._auth_token,
             "message": "Login successful",
             "note": "This token can be used in MCP_QUADS__AUTH_TOKEN environment variable",
         }
 
-    except Exception as e:
+    except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
         error_msg = f"Login error: {str(e)}"
-        ctx.error(error_msg)
+        _log(ctx, "error", error_msg)
         return {"error": error_msg}
 
 
@@ -129,13 +264,15 @@ async def quads_get_clouds(ctx: Context) -> Dict[str, Any]:
     Returns:
         List of all clouds
     """
-    ctx.info("Fetching all clouds from QUADS")
+    _log(ctx, "info", "Fetching all clouds from QUADS")
 
-    result = await make_quads_request("GET", "/clouds/", ctx)
+    result = await make_quads_request("GET", "/clouds/", ctx, cache_ttl=30)
 
     if "error" not in result:
-        ctx.info(
-            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} clouds"
+        _log(
+            ctx,
+            "info",
+            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} clouds",
         )
         return {"clouds": result}
 
@@ -153,13 +290,15 @@ async def quads_get_free_clouds(ctx: Context) -> Dict[str, Any]:
     Returns:
         List of free clouds
     """
-    ctx.info("Fetching free clouds from QUADS")
+    _log(ctx, "info", "Fetching free clouds from QUADS")
 
-    result = await make_quads_request("GET", "/clouds/free/", ctx)
+    result = await make_quads_request("GET", "/clouds/free/", ctx, cache_ttl=30)
 
     if "error" not in result:
-        ctx.info(
-            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} free clouds"
+        _log(
+            ctx,
+            "info",
+            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} free clouds",
         )
         return {"free_clouds": result}
 
@@ -187,24 +326,27 @@ async def quads_get_hosts(
     Returns:
         List of hosts matching the criteria
     """
-    # Build query parameters
-    params = {}
-    if name:
-        params["name"] = name
-    if model:
-        params["model"] = model
-    if host_type:
-        params["host_type"] = host_type
-    if broken is not None:
-        params["broken"] = str(broken).lower()
+    # Build query parameters, dropping unset filters
+    params = {
+        key: value
+        for key, value in (
+            ("name", name),
+            ("model", model),
+            ("host_type", host_type),
+            ("broken", None if broken is None else str(broken).lower()),
+        )
+        if value
+    }
 
-    ctx.info(f"Fetching hosts from QUADS with filters: {params}")
+    _log(ctx, "info", f"Fetching hosts from QUADS with filters: {params}")
 
     result = await make_quads_request("GET", "/hosts/", ctx, params=params)
 
     if "error" not in result:
-        ctx.info(
-            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} hosts"
+        _log(
+            ctx,
+            "info",
+            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} hosts",
         )
         return {"hosts": result, "filters": params}
 
@@ -223,17 +365,59 @@ async def quads_get_host_details(hostname: str, ctx: Context) -> Dict[str, Any]:
     Returns:
         Detailed host information including hardware specs
     """
-    ctx.info(f"Fetching details for host: {hostname}")
+    _log(ctx, "info", f"Fetching details for host: {hostname}")
 
     result = await make_quads_request("GET", f"/hosts/{hostname}/", ctx)
 
     if "error" not in result:
-        ctx.info(f"Retrieved details for host {hostname}")
+        _log(ctx, "info", f"Retrieved details for host {hostname}")
         return {"host": result}
 
     return result
 
 
+@mcp.tool()
+async def quads_get_hosts_details(hostnames: List[str], ctx: Context) -> Dict[str, Any]:
+    """
+    Get detailed information about several hosts concurrently.
+
+    Args:
+        hostnames: The hostnames to get details for
+        ctx: The Context object (automatically injected)
+
+    Returns:
+        Detailed host information (or an error) for each hostname
+    """
+    _log(ctx, "info", f"Fetching details for {len(hostnames)} hosts")
+
+    # Cap concurrency so a large batch doesn't exhaust the connection pool
+    semaphore = asyncio.Semaphore(20)
+
+    async def fetch(hostname: str) -> Dict[str, Any]:
+        async with semaphore:
+            result = await make_quads_request("GET", f"/hosts/{hostname}/", ctx)
+        if "error" in result:
+            return {"hostname": hostname, **result}
+        return {"hostname": hostname, "host": result}
+
+    results = await asyncio.gather(
+        *(fetch(hostname) for hostname in hostnames), return_exceptions=True
+    )
+
+    # A failure for one hostname must not drop the results for the others
+    hosts = [
+        (
+            {"hostname": hostname, "error": f"QUADS API request failed: {result}"}
+            if isinstance(result, Exception)
+            else result
+        )
+        for hostname, result in zip(hostnames, results)
+    ]
+
+    _log(ctx, "info", f"Retrieved details for {len(hosts)} hosts")
+    return {"hosts": hosts}
+
+
 @mcp.tool()
 async def quads_get_available_hosts(
     start: Optional[str] = None,
@@ -253,21 +437,21 @@ async def quads_get_available_hosts(
     Returns:
         List of available hosts
     """
-    params = {}
-    if start:
-        params["start"] = start
-    if end:
-        params["end"] = end
-    if cloud:
-        params["cloud"] = cloud
+    params = {
+        key: value
+        for key, value in (("start", start), ("end", end), ("cloud", cloud))
+        if value
+    }
 
-    ctx.info(f"Fetching available hosts with parameters: {params}")
+    _log(ctx, "info", f"Fetching available hosts with parameters: {params}")
 
     result = await make_quads_request("GET", "/available/", ctx, params=params)
 
     if "error" not in result:
-        ctx.info(
-            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} available hosts"
+        _log(
+            ctx,
+            "info",
+            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} available hosts",
         )
         return {"available_hosts": result, "parameters": params}
 
@@ -293,20 +477,20 @@ async def quads_check_host_availability(
     Returns:
         Host availability status
     """
-    params = {}
-    if start:
-        params["start"] = start
-    if end:
-        params["end"] = end
+    params = {key: value for key, value in (("start", start), ("end", end)) if value}
 
-    ctx.info(f"Checking availability for host {hostname} with parameters: {params}")
+    _log(
+        ctx,
+        "info",
+        f"Checking availability for host {hostname} with parameters: {params}",
+    )
 
     result = await make_quads_request(
         "GET", f"/available/{hostname}/", ctx, params=params
     )
 
     if "error" not in result:
-        ctx.info(f"Checked availability for host {hostname}")
+        _log(ctx, "info", f"Checked availability for host {hostname}")
         return {"hostname": hostname, "availability": result, "parameters": params}
 
     return result
@@ -323,13 +507,15 @@ async def quads_get_schedules(ctx: Context) -> Dict[str, Any]:
     Returns:
         List of all schedules
     """
-    ctx.info("Fetching all schedules from QUADS")
+    _log(ctx, "info", "Fetching all schedules from QUADS")
 
     result = await make_quads_request("GET", "/schedules/", ctx)
 
     if "error" not in result:
-        ctx.info(
-            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} schedules"
+        _log(
+            ctx,
+            "info",
+            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} schedules",
         )
         return {"schedules": result}
 
@@ -355,20 +541,20 @@ async def quads_get_current_schedules(
     Returns:
         List of current schedules
     """
-    params = {}
-    if date:
-        params["date"] = date
-    if host:
-        params["host"] = host
-    if cloud:
-        params["cloud"] = cloud
+    params = {
+        key: value
+        for key, value in (("date", date), ("host", host), ("cloud", cloud))
+        if value
+    }
 
-    ctx.info(f"Fetching current schedules with parameters: {params}")
+    _log(ctx, "info", f"Fetching current schedules with parameters: {params}")
 
-    result = await make_quads_request("GET", "/schedules/current/", ctx, params=params)
+    result = await make_quads_request(
+        "GET", "/schedules/current/", ctx, cache_ttl=10, params=params
+    )
 
     if "error" not in result:
-        ctx.info(f"Retrieved current schedules")
+        _log(ctx, "info", f"Retrieved current schedules")
         return {"current_schedules": result, "parameters": params}
 
     return result
@@ -385,12 +571,12 @@ async def quads_get_assignments(ctx: Context) -> Dict[str, Any]:
     Returns:
         List of all assignments
     """
-    ctx.info("Fetching all assignments from QUADS")
+    _log(ctx, "info", "Fetching all assignments from QUADS")
 
-    result = await make_quads_request("GET", "/assignments/", ctx)
+    result = await make_quads_request("GET", "/assignments/", ctx, cache_ttl=30)
 
     if "error" not in result:
-        ctx.info(f"Retrieved assignments")
+        _log(ctx, "info", f"Retrieved assignments")
         return {"assignments": result}
 
     return result
@@ -412,15 +598,15 @@ async def quads_get_active_assignments(
     """
     if cloud_name:
         endpoint = f"/assignments/active/{cloud_name}/"
-        ctx.info(f"Fetching active assignments for cloud: {cloud_name}")
+        _log(ctx, "info", f"Fetching active assignments for cloud: {cloud_name}")
     else:
         endpoint = "/assignments/active/"
-        ctx.info("Fetching all active assignments")
+        _log(ctx, "info", "Fetching all active assignments")
 
     result = await make_quads_request("GET", endpoint, ctx)
 
     if "error" not in result:
-        ctx.info(f"Retrieved active assignments")
+        _log(ctx, "info", f"Retrieved active assignments")
         return {"active_assignments": result, "cloud_filter": cloud_name}
 
     return result
@@ -440,17 +626,17 @@ async def quads_get_moves(
     Returns:
         List of host moves
     """
-    params = {}
-    if date:
-        params["date"] = date
+    params = {"date": date} if date else {}
 
-    ctx.info(f"Fetching moves with parameters: {params}")
+    _log(ctx, "info", f"Fetching moves with parameters: {params}")
 
     result = await make_quads_request("GET", "/moves/", ctx, params=params)
 
     if "error" not in result:
-        ctx.info(
-            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} moves"
+        _log(
+            ctx,
+            "info",
+            f"Retrieved {len(result) if isinstance(result, list) else 'unknown'} moves",
         )
         return {"moves": result, "parameters": params}
 
@@ -468,12 +654,12 @@ async def quads_get_version(ctx: Context) -> Dict[str, Any]:
     Returns:
         QUADS version information
     """
-    ctx.info("Fetching QUADS version")
+    _log(ctx, "info", "Fetching QUADS version")
 
-    result = await make_quads_request("GET", "/version/", ctx)
+    result = await make_quads_request("GET", "/version/", ctx, cache_ttl=600)
 
     if "error" not in result:
-        ctx.info("Retrieved QUADS version")
+        _log(ctx, "info", "Retrieved QUADS version")
         return {"version": result}
 
     return result